@@ -4,6 +4,7 @@ Manages the interview flow with adaptive difficulty and early termination
 RULE-BASED (No external AI API required)
 """
 
+from collections import deque
 from typing import Dict, List, Tuple
 import random
 
@@ -17,67 +18,104 @@ class InterviewEngine:
         self.question_count = 0
         self.max_questions = 10
         self.question_types = ['technical', 'conceptual', 'behavioral', 'scenario-based']
+        self._combined_skills = None  # set once by bind_context
+        # Running score stats so the adaptive logic is O(1) per answer
+        # instead of re-summing the whole history
+        self._score_sum = 0.0
+        self._score_count = 0
+        self._last_three = deque(maxlen=3)
+        # Private RNG instance skips the shared global-state handling
+        # in the module-level random functions
+        self._rng = random.Random()
 
     # ------------------------------------------------------------------
     # QUESTION BANK (Skill-aware, difficulty-aware)
     # ------------------------------------------------------------------
     QUESTION_BANK = {
         "easy": {
-            "technical": [
+            "technical": (
                 "What is {skill} and where have you used it?",
                 "Explain basic features of {skill}."
-            ],
-            "conceptual": [
+            ),
+            "conceptual": (
                 "What problem does {skill} solve?",
                 "Explain core concepts of {skill}."
-            ],
-            "behavioral": [
+            ),
+            "behavioral": (
                 "Tell me about a project you enjoyed working on.",
                 "How do you approach learning a new technology?"
-            ],
-            "scenario-based": [
+            ),
+            "scenario-based": (
                 "How would you debug a simple error in your application?",
                 "What steps do you take when your code doesn’t work?"
-            ]
+            )
         },
         "medium": {
-            "technical": [
+            "technical": (
                 "How would you optimize performance in a {skill} project?",
                 "Explain common challenges you faced while using {skill}."
-            ],
-            "conceptual": [
+            ),
+            "conceptual": (
                 "Compare {skill} with an alternative technology.",
                 "Explain trade-offs involved when using {skill}."
-            ],
-            "behavioral": [
+            ),
+            "behavioral": (
                 "Describe a challenging project and how you handled it.",
                 "Tell me about a time you worked under pressure."
-            ],
-            "scenario-based": [
+            ),
+            "scenario-based": (
                 "How would you design a scalable web application?",
                 "How would you handle a production bug reported by users?"
-            ]
+            )
         },
         "hard": {
-            "technical": [
+            "technical": (
                 "Design a scalable system using {skill} for millions of users.",
                 "How would you improve fault tolerance in a {skill} system?"
-            ],
-            "conceptual": [
+            ),
+            "conceptual": (
                 "Explain internal architecture or algorithms behind {skill}.",
                 "Discuss limitations of {skill} in large-scale systems."
-            ],
-            "behavioral": [
+            ),
+            "behavioral": (
                 "Tell me about a critical technical decision you made.",
                 "How do you balance speed vs quality in deadlines?"
-            ],
-            "scenario-based": [
+            ),
+            "scenario-based": (
                 "A production system goes down suddenly. Walk me through your response.",
                 "How would you redesign a legacy system for scalability?"
-            ]
+            )
         }
     }
 
+    # Flattened (difficulty, type) -> templates view of QUESTION_BANK:
+    # one dict lookup per question instead of two
+    _FLAT_BANK = {
+        (difficulty, q_type): templates
+        for difficulty, by_type in QUESTION_BANK.items()
+        for q_type, templates in by_type.items()
+    }
+
+    # Difficulty transitions as lookup tables instead of if-ladders
+    _DIFFICULTY_UP = {'easy': 'medium', 'medium': 'hard', 'hard': 'hard'}
+    _DIFFICULTY_DOWN = {'hard': 'medium', 'medium': 'easy', 'easy': 'easy'}
+
+    # ------------------------------------------------------------------
+    # SESSION CONTEXT
+    # ------------------------------------------------------------------
+    def bind_context(self, resume_data: Dict, jd_data: Dict):
+        """
+        Combine resume and JD skills once for the whole interview,
+        instead of re-flattening both dicts on every question
+        """
+        # resume_data may be a ResumeResult or the legacy dict shape
+        skills_map = getattr(resume_data, "skills", None)
+        if skills_map is None:
+            skills_map = resume_data.get("skills", {})
+        resume_skills = {s for v in skills_map.values() for s in v}
+        jd_skills = {s for v in jd_data.get("required_skills", {}).values() for s in v}
+        self._combined_skills = tuple(resume_skills | jd_skills) or ("programming",)
+
     # ------------------------------------------------------------------
     # QUESTION GENERATION
     # ------------------------------------------------------------------
@@ -93,63 +131,60 @@ class InterviewEngine:
         Generate interview question without external AI
         """
 
-        resume_skills_dict = resume_data.get("skills", {})
-        jd_skills_dict = jd_data.get("required_skills", {})
-        resume_skills = []
-        for v in resume_skills_dict.values():
-            resume_skills.extend(v)
-
-        jd_skills = []
-        for v in jd_skills_dict.values():
-            jd_skills.extend(v)
-
-        # Pick relevant skill
-        combined_skills = list(set(resume_skills + jd_skills))
-        skill = random.choice(combined_skills) if combined_skills else "programming"
+        # Pick relevant skill from the cached per-session tuple
+        if self._combined_skills is None:
+            self.bind_context(resume_data, jd_data)
+        skill = self._rng.choice(self._combined_skills)
 
         # Select question
-        templates = self.QUESTION_BANK[difficulty][question_type]
-        question_template = random.choice(templates)
+        templates = self._FLAT_BANK[(difficulty, question_type)]
+        question_template = self._rng.choice(templates)
         question = question_template.format(skill=skill)
 
         expected_topics = [skill, question_type, difficulty]
 
         return question, expected_topics
 
+    # ------------------------------------------------------------------
+    # SCORE TRACKING
+    # ------------------------------------------------------------------
+    def record_score(self, score: float):
+        """Fold a new answer score into the running stats"""
+        self._score_sum += score
+        self._score_count += 1
+        self._last_three.append(score)
+
     # ------------------------------------------------------------------
     # ADAPTIVE DIFFICULTY
     # ------------------------------------------------------------------
-    def adjust_difficulty(self, recent_scores: List[float]) -> str:
-        if not recent_scores:
+    def adjust_difficulty(self, recent_scores: List[float] = None) -> str:
+        # Callers that use record_score can omit the history entirely
+        if recent_scores is not None:
+            if not recent_scores:
+                return self.current_difficulty
+            avg_score = sum(recent_scores) / len(recent_scores)
+        elif self._score_count:
+            avg_score = self._score_sum / self._score_count
+        else:
             return self.current_difficulty
 
-        avg_score = sum(recent_scores) / len(recent_scores)
-
         if avg_score > 75:
-            if self.current_difficulty == "easy":
-                self.current_difficulty = "medium"
-            elif self.current_difficulty == "medium":
-                self.current_difficulty = "hard"
-
+            self.current_difficulty = self._DIFFICULTY_UP[self.current_difficulty]
         elif avg_score < 40:
-            if self.current_difficulty == "hard":
-                self.current_difficulty = "medium"
-            elif self.current_difficulty == "medium":
-                self.current_difficulty = "easy"
+            self.current_difficulty = self._DIFFICULTY_DOWN[self.current_difficulty]
 
         return self.current_difficulty
 
     # ------------------------------------------------------------------
     # EARLY TERMINATION
     # ------------------------------------------------------------------
-    def should_terminate_early(self, recent_scores: List[float]) -> bool:
-        if len(recent_scores) < 3:
-            return False
+    def should_terminate_early(self, recent_scores: List[float] = None) -> bool:
+        last_three = recent_scores[-3:] if recent_scores is not None else self._last_three
 
-        last_three = recent_scores[-3:]
-        avg_last_three = sum(last_three) / 3
+        if len(last_three) < 3:
+            return False
 
-        return avg_last_three < 30
+        return sum(last_three) / 3 < 30
 
     # ------------------------------------------------------------------
     # QUESTION TYPE ROTATION
@@ -185,3 +220,7 @@ class InterviewEngine:
     def reset(self):
         self.current_difficulty = "easy"
         self.question_count = 0
+        self._combined_skills = None
+        self._score_sum = 0.0
+        self._score_count = 0
+        self._last_three.clear()
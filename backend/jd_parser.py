@@ -6,6 +6,16 @@ Extracts required skills and role expectations from job descriptions
 import re
 from typing import Dict, List, Set
 
+try:
+    import ahocorasick
+except ImportError:  # optional speedup; regex fallback is used instead
+    ahocorasick = None
+
+try:
+    import hyperscan
+except ImportError:  # optional; Aho-Corasick or regex is used instead
+    hyperscan = None
+
 
 class JDParser:
     """Parses job descriptions to extract requirements and expectations"""
@@ -30,79 +40,196 @@ class JDParser:
         # Keywords indicating required vs preferred
         self.required_keywords = ['required', 'must have', 'mandatory', 'essential']
         self.preferred_keywords = ['preferred', 'nice to have', 'plus', 'bonus']
-    
-    def extract_required_skills(self, text: str) -> Dict[str, List[str]]:
+
+        # Integer IDs for every skill so a document's skill set can be
+        # packed into one int bitmask for bulk matching
+        self.skill_vocabulary = tuple(
+            skill for skills in self.tech_skills.values() for skill in skills
+        )
+        self.skill_id = {skill: i for i, skill in enumerate(self.skill_vocabulary)}
+
+        # Precompile one alternation pattern per category so each JD is
+        # scanned once per category instead of once per skill.
+        # Longest skills first so "google cloud" matches before "cloud"
+        self._category_patterns = {
+            category: re.compile(
+                r'\b(?:' +
+                '|'.join(sorted((re.escape(s) for s in skills), key=len, reverse=True)) +
+                r')\b'
+            )
+            for category, skills in self.tech_skills.items()
+        }
+
+        # All experience phrasings fused into one pattern: one scan of the
+        # JD instead of four, and IGNORECASE avoids a lowercased copy
+        self._experience_pattern = re.compile(
+            r'(?:(\d+)\+?\s*years?\s*of\s*experience'
+            r'|minimum\s+(\d+)\+?\s*years?'
+            r'|(\d+)\+?\s*years?\s*experience\s*required'
+            r'|at least\s+(\d+)\+?\s*years?)',
+            re.IGNORECASE
+        )
+
+        # Section headers matched per line, so no DOTALL backtracking over
+        # the whole JD; responsibilities headers are the subset we keep
+        self._section_header_pattern = re.compile(
+            r'\b(?:responsibilities?|duties|what you.?ll do|requirements?'
+            r'|qualifications?|skills?|preferred|nice to have|bonus)\b'
+        )
+        self._resp_header_pattern = re.compile(
+            r'\b(?:responsibilities?|duties|what you.?ll do)\b'
+        )
+        # Bullet and hyphen delimiters for responsibility fragments
+        self._bullet_split_pattern = re.compile(r'[•\-]')
+
+        # Seniority keywords as single-pass patterns; word boundaries stop
+        # false positives like "leader", "seniority" or "architectural"
+        self._senior_pattern = re.compile(r'\b(?:senior|lead|principal|staff|architect)\b')
+        self._junior_pattern = re.compile(r'\b(?:junior|entry|graduate|fresher)\b')
+
+        # Aho-Corasick automaton: finds every skill in one linear pass
+        # over the JD instead of one regex scan per category
+        self._skill_automaton = None
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for category, skills in self.tech_skills.items():
+                for skill in skills:
+                    automaton.add_word(skill, (category, skill))
+            automaton.make_automaton()
+            self._skill_automaton = automaton
+
+        # Hyperscan database for bulk ingestion: compiles every skill
+        # pattern into one SIMD-scanned DFA. Preferred when installed
+        self._hs_db = None
+        self._hs_vocabulary = None
+        if hyperscan is not None:
+            vocabulary = [
+                (category, skill)
+                for category, skills in self.tech_skills.items()
+                for skill in skills
+            ]
+            db = hyperscan.Database()
+            db.compile(
+                expressions=[
+                    rb'\b' + re.escape(skill).encode() + rb'\b'
+                    for _, skill in vocabulary
+                ],
+                ids=list(range(len(vocabulary))),
+                flags=[hyperscan.HS_FLAG_CASELESS] * len(vocabulary)
+            )
+            self._hs_db = db
+            self._hs_vocabulary = vocabulary
+
+    @staticmethod
+    def _is_word_char(char: str) -> bool:
+        """Word character in the regex \\b sense"""
+        return char.isalnum() or char == '_'
+
+    def extract_required_skills(self, text: str, text_lower: str = None) -> Dict[str, List[str]]:
         """Extract required technical skills from JD"""
-        text_lower = text.lower()
-        required_skills = {}
-        
-        for category, skills in self.tech_skills.items():
-            found_skills = []
-            for skill in skills:
-                pattern = r'\b' + re.escape(skill) + r'\b'
-                if re.search(pattern, text_lower):
-                    found_skills.append(skill.title())
-            
-            if found_skills:
-                required_skills[category] = found_skills
-        
-        return required_skills
+        if text_lower is None:
+            text_lower = text.lower()
+
+        if self._hs_db is not None:
+            found = self._scan_hyperscan(text_lower)
+        elif self._skill_automaton is not None:
+            found = self._scan_automaton(text_lower)
+        else:
+            found = {
+                category: {skill.title() for skill in pattern.findall(text_lower)}
+                for category, pattern in self._category_patterns.items()
+            }
+
+        # Keep the category ordering of tech_skills for stable output
+        return {category: sorted(found[category]) for category in self.tech_skills
+                if found.get(category)}
+
+    def _scan_hyperscan(self, text_lower: str) -> Dict[str, Set[str]]:
+        """Find all skills with one pass of the Hyperscan database"""
+        matched_ids = set()
+
+        def on_match(pattern_id, start, end, flags, context):
+            matched_ids.add(pattern_id)
+
+        self._hs_db.scan(text_lower.encode('utf-8', 'ignore'),
+                         match_event_handler=on_match)
+
+        found = {}
+        for pattern_id in matched_ids:
+            category, skill = self._hs_vocabulary[pattern_id]
+            found.setdefault(category, set()).add(skill.title())
+        return found
+
+    def _scan_automaton(self, text_lower: str) -> Dict[str, Set[str]]:
+        """Find all skills with one pass of the Aho-Corasick automaton"""
+        found = {}
+        for end_idx, (category, skill) in self._skill_automaton.iter(text_lower):
+            # Enforce the same word boundaries the regex patterns use
+            start_idx = end_idx - len(skill) + 1
+            prev_is_word = start_idx > 0 and self._is_word_char(text_lower[start_idx - 1])
+            next_is_word = end_idx + 1 < len(text_lower) and self._is_word_char(text_lower[end_idx + 1])
+            if prev_is_word == self._is_word_char(skill[0]):
+                continue
+            if next_is_word == self._is_word_char(skill[-1]):
+                continue
+            found.setdefault(category, set()).add(skill.title())
+        return found
     
     def extract_experience_required(self, text: str) -> int:
         """Extract required years of experience"""
-        patterns = [
-            r'(\d+)\+?\s*years?\s*of\s*experience',
-            r'minimum\s+(\d+)\+?\s*years?',
-            r'(\d+)\+?\s*years?\s*experience\s*required',
-            r'at least\s+(\d+)\+?\s*years?'
-        ]
-        
         max_years = 0
-        for pattern in patterns:
-            matches = re.findall(pattern, text.lower())
-            for match in matches:
-                max_years = max(max_years, int(match))
-        
+        for match in self._experience_pattern.finditer(text):
+            for group in match.groups():
+                if group:
+                    max_years = max(max_years, int(group))
+
         return max_years if max_years > 0 else 2  # Default to 2 years
     
-    def extract_role_level(self, text: str) -> str:
+    def extract_role_level(self, text: str, text_lower: str = None) -> str:
         """Determine the seniority level of the role"""
-        text_lower = text.lower()
-        
-        if any(word in text_lower for word in ['senior', 'lead', 'principal', 'staff', 'architect']):
+        if text_lower is None:
+            text_lower = text.lower()
+
+        if self._senior_pattern.search(text_lower):
             return 'senior'
-        elif any(word in text_lower for word in ['junior', 'entry', 'graduate', 'fresher']):
+        elif self._junior_pattern.search(text_lower):
             return 'junior'
         else:
             return 'mid'
     
-    def extract_responsibilities(self, text: str) -> List[str]:
+    def extract_responsibilities(self, text: str, text_lower: str = None) -> List[str]:
         """Extract key responsibilities from JD"""
+        if text_lower is None:
+            text_lower = text.lower()
+
         responsibilities = []
-        
-        # Look for responsibilities section
-        resp_section = re.search(
-            r'(responsibilities?|duties|what you.?ll do)(.*?)(requirements?|qualifications?|skills?|$)',
-            text.lower(),
-            re.DOTALL
-        )
-        
-        if resp_section:
-            section_text = resp_section.group(2)
-            # Split by bullet points or newlines
-            lines = re.split(r'[•\-\n]', section_text)
-            for line in lines:
-                line = line.strip()
-                if len(line) > 20 and len(line) < 200:
-                    responsibilities.append(line[:150])
+        in_section = False
+
+        # Single linear pass over the lines: track whether we are inside
+        # a responsibilities section and collect bullet fragments
+        for line in text_lower.splitlines():
+            stripped = line.strip()
+            # Headers are short standalone lines ("Key Responsibilities:"),
+            # not bullet items that happen to mention a keyword
+            if (len(stripped) <= 60 and not stripped.startswith(('•', '-'))
+                    and self._section_header_pattern.search(stripped)):
+                in_section = bool(self._resp_header_pattern.search(stripped))
+                continue
+            if not in_section:
+                continue
+            for fragment in self._bullet_split_pattern.split(line):
+                fragment = fragment.strip()
+                if 20 < len(fragment) < 200:
+                    responsibilities.append(fragment[:150])
                 if len(responsibilities) >= 5:
-                    break
-        
+                    return responsibilities
+
         return responsibilities
     
-    def categorize_skills(self, text: str) -> Dict[str, List[str]]:
+    def categorize_skills(self, text: str, text_lower: str = None) -> Dict[str, List[str]]:
         """Categorize skills into required and preferred"""
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         
         # Try to find requirements section
         req_section = re.search(
@@ -135,17 +262,21 @@ class JDParser:
         Returns:
             Dictionary containing extracted JD information
         """
-        required_skills = self.extract_required_skills(jd_text)
+        # Lowercase the JD once; every extractor below reuses this copy
+        text_lower = jd_text.lower()
+
+        required_skills = self.extract_required_skills(jd_text, text_lower)
         experience_required = self.extract_experience_required(jd_text)
-        role_level = self.extract_role_level(jd_text)
-        responsibilities = self.extract_responsibilities(jd_text)
-        skill_categories = self.categorize_skills(jd_text)
+        role_level = self.extract_role_level(jd_text, text_lower)
+        responsibilities = self.extract_responsibilities(jd_text, text_lower)
+        skill_categories = self.categorize_skills(jd_text, text_lower)
         
         # Count total required skills
         total_required_skills = sum(len(skill_list) for skill_list in required_skills.values())
-        
+
         return {
             'required_skills': required_skills,
+            'skills_flat_lc': self._flatten_skills(required_skills),
             'total_required_skills': total_required_skills,
             'experience_required': experience_required,
             'role_level': role_level,
@@ -153,37 +284,87 @@ class JDParser:
             'skill_categories': skill_categories
         }
     
-    def compute_skill_match(self, resume_skills: Dict[str, List[str]], 
-                           jd_skills: Dict[str, List[str]]) -> Dict:
+    def encode_skills(self, skills) -> int:
+        """Pack a skill dict (or flat lowercase set) into an int bitmask"""
+        mask = 0
+        for skill in self._flatten_skills(skills):
+            skill_id = self.skill_id.get(skill)
+            if skill_id is not None:
+                mask |= 1 << skill_id
+        return mask
+
+    def compute_skill_match_masks(self, resume_mask: int, jd_mask: int) -> Dict:
+        """
+        Compute skill match from two encoded bitmasks
+
+        Same result shape as compute_skill_match, but intersection and
+        difference are single bitwise operations plus popcounts - suited
+        to matching one resume against many JDs (or vice versa).
+        """
+        matched_mask = resume_mask & jd_mask
+        missing_mask = jd_mask & ~resume_mask
+        total_jd_skills = jd_mask.bit_count()
+
+        if total_jd_skills:
+            match_percentage = (matched_mask.bit_count() / total_jd_skills) * 100
+        else:
+            match_percentage = 0
+
+        return {
+            'match_percentage': round(match_percentage, 2),
+            'matched_skills': self._decode_mask(matched_mask),
+            'missing_skills': self._decode_mask(missing_mask),
+            'total_jd_skills': total_jd_skills,
+            'total_matched': matched_mask.bit_count()
+        }
+
+    def compute_skill_match_batch(self, resume_masks: List[int], jd_mask: int) -> List[float]:
+        """Match percentages for many encoded resumes against one JD"""
+        total_jd_skills = jd_mask.bit_count()
+        if not total_jd_skills:
+            return [0.0] * len(resume_masks)
+        scale = 100.0 / total_jd_skills
+        return [(mask & jd_mask).bit_count() * scale for mask in resume_masks]
+
+    def _decode_mask(self, mask: int) -> List[str]:
+        """Expand a bitmask back into skill names"""
+        return [
+            skill for i, skill in enumerate(self.skill_vocabulary) if mask & (1 << i)
+        ]
+
+    @staticmethod
+    def _flatten_skills(skills) -> frozenset:
+        """Flatten a category->skills dict to a lowercase frozenset"""
+        if isinstance(skills, frozenset):
+            return skills
+        return frozenset(
+            skill.lower() for skill_list in skills.values() for skill in skill_list
+        )
+
+    def compute_skill_match(self, resume_skills, jd_skills) -> Dict:
         """
         Compute skill match percentage between resume and JD
-        
+
         Args:
-            resume_skills: Skills extracted from resume
-            jd_skills: Skills extracted from job description
-        
+            resume_skills: Skills from resume (category dict or flat lowercase frozenset)
+            jd_skills: Skills from JD (category dict or flat lowercase frozenset)
+
         Returns:
             Dictionary with match percentage and details
         """
-        # Flatten skills to sets for comparison
-        resume_skill_set = set()
-        for skills in resume_skills.values():
-            resume_skill_set.update([s.lower() for s in skills])
-        
-        jd_skill_set = set()
-        for skills in jd_skills.values():
-            jd_skill_set.update([s.lower() for s in skills])
-        
-        # Calculate matches
-        matched_skills = resume_skill_set.intersection(jd_skill_set)
+        # Parsed data already carries flat lowercase sets (skills_flat_lc),
+        # so matching is two hash-set operations with no per-call lowercasing
+        resume_skill_set = self._flatten_skills(resume_skills)
+        jd_skill_set = self._flatten_skills(jd_skills)
+
+        matched_skills = resume_skill_set & jd_skill_set
         missing_skills = jd_skill_set - resume_skill_set
-        
-        # Calculate match percentage
-        if len(jd_skill_set) == 0:
-            match_percentage = 0
-        else:
+
+        if jd_skill_set:
             match_percentage = (len(matched_skills) / len(jd_skill_set)) * 100
-        
+        else:
+            match_percentage = 0
+
         return {
             'match_percentage': round(match_percentage, 2),
             'matched_skills': list(matched_skills),
@@ -5,11 +5,14 @@ Handles all API endpoints for the Hack2Hire platform
 
 from fastapi import FastAPI, File, UploadFile, HTTPException, Form
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
+from cachetools import TTLCache
 from typing import Optional, List, Dict
+import asyncio
 import os
-from datetime import datetime
+import secrets
+import time
 
 from resume_parser import ResumeParser
 from jd_parser import JDParser
@@ -20,7 +23,10 @@ from scoring_engine import ScoringEngine
 app = FastAPI(
     title="Hack2Hire - AI Mock Interview Platform",
     description="AI-powered mock interview platform with adaptive difficulty",
-    version="1.0.0"
+    version="1.0.0",
+    # orjson serializes the nested skill/score dicts several times
+    # faster than the stdlib json encoder
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -36,8 +42,12 @@ app.add_middleware(
 resume_parser = ResumeParser()
 jd_parser = JDParser()
 
-# Store active interview sessions
-active_sessions = {}
+# Largest resume upload accepted, checked before any parsing work
+MAX_RESUME_BYTES = 10 * 1024 * 1024
+
+# Store active interview sessions, bounded so abandoned sessions are
+# evicted instead of accumulating for the life of the process
+active_sessions = TTLCache(maxsize=10_000, ttl=3600)
 
 
 class JobDescription(BaseModel):
@@ -54,6 +64,11 @@ class Answer(BaseModel):
 
 class SessionData:
     """Store session-specific data"""
+    # Slots cut per-instance memory, which matters with up to 10k
+    # sessions alive in the TTL cache
+    __slots__ = ('resume_data', 'jd_data', 'interview_engine', 'scoring_engine',
+                 'questions_asked', 'answers_given', 'scores', 'created_at')
+
     def __init__(self):
         self.resume_data = None
         self.jd_data = None
@@ -62,7 +77,7 @@ class SessionData:
         self.questions_asked = []
         self.answers_given = []
         self.scores = []
-        self.created_at = datetime.now()
+        self.created_at = time.monotonic()  # for TTL comparisons only
 
 
 @app.get("/")
@@ -95,15 +110,23 @@ async def upload_resume(file: UploadFile = File(...)):
                 detail="Only PDF and TXT files are supported"
             )
         
-        # Read file content
-        content = await file.read()
+        # Reject oversized uploads before any parsing work
+        if file.size is not None and file.size > MAX_RESUME_BYTES:
+            raise HTTPException(
+                status_code=413,
+                detail="Resume file too large (10 MB limit)"
+            )
         
-        # Parse resume
+        # Parse resume off the event loop; PDF extraction and the regex
+        # scans are CPU-bound and would stall other requests otherwise.
+        # The upload stays in its spooled temporary file rather than
+        # being buffered into one bytes object
         is_pdf = file.content_type == 'application/pdf'
-        resume_data = resume_parser.parse(content, is_pdf=is_pdf)
+        resume_data = await asyncio.to_thread(resume_parser.parse_stream, file.file, is_pdf)
         
-        # Create new session
-        session_id = f"session_{datetime.now().timestamp()}"
+        # Create new session; token_hex is collision-safe under
+        # concurrent uploads, unlike a wall-clock timestamp
+        session_id = secrets.token_hex(12)
         session = SessionData()
         session.resume_data = resume_data
         active_sessions[session_id] = session
@@ -112,13 +135,15 @@ async def upload_resume(file: UploadFile = File(...)):
             "success": True,
             "session_id": session_id,
             "resume_data": {
-                "skills": resume_data['skills'],
-                "total_skills": resume_data['total_skills'],
-                "experience_years": resume_data['experience']['years'],
-                "projects_found": len(resume_data['projects'])
+                "skills": resume_data.skills,
+                "total_skills": resume_data.total_skills,
+                "experience_years": resume_data.experience.years,
+                "projects_found": len(resume_data.projects)
             }
         }
-    
+
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error parsing resume: {str(e)}")
 
@@ -148,14 +173,14 @@ async def analyze_job_description(
         if not session.resume_data:
             raise HTTPException(status_code=400, detail="Resume not uploaded yet")
         
-        # Parse JD
-        jd_data = jd_parser.parse(jd_text)
+        # Parse JD off the event loop (CPU-bound regex/automaton scans)
+        jd_data = await asyncio.to_thread(jd_parser.parse, jd_text)
         session.jd_data = jd_data
         
-        # Compute skill match
+        # Compute skill match from the two flat lowercase sets
         skill_match = jd_parser.compute_skill_match(
-            session.resume_data['skills'],
-            jd_data['required_skills']
+            session.resume_data.skills_flat_lc,
+            jd_data['skills_flat_lc']
         )
         
         return {
@@ -201,6 +226,7 @@ async def start_interview(session_id: str = Form(...)):
         
         # Initialize interview components
         session.interview_engine = InterviewEngine()
+        session.interview_engine.bind_context(session.resume_data, session.jd_data)
         session.scoring_engine = ScoringEngine()
         
         # Get first question
@@ -265,12 +291,10 @@ async def submit_answer(answer_data: Answer):
             'time_taken': answer_data.time_taken
         })
         session.scores.append(score)
-        
-        # Get recent scores for adaptive logic
-        recent_overall_scores = [s['overall'] for s in session.scores]
+        session.interview_engine.record_score(score['overall'])
         
         # Check for early termination
-        should_terminate = session.interview_engine.should_terminate_early(recent_overall_scores)
+        should_terminate = session.interview_engine.should_terminate_early()
         
         # Check if we've reached max questions
         max_questions_reached = session.interview_engine.question_count >= session.interview_engine.max_questions
@@ -302,7 +326,7 @@ async def submit_answer(answer_data: Answer):
         
         else:
             # Continue interview - adjust difficulty and get next question
-            new_difficulty = session.interview_engine.adjust_difficulty(recent_overall_scores)
+            new_difficulty = session.interview_engine.adjust_difficulty()
             
             next_question = session.interview_engine.conduct_interview(
                 session.resume_data,
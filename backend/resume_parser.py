@@ -3,151 +3,397 @@ Resume Parser Module
 Extracts skills, experience, and projects from uploaded resumes
 """
 
+import hashlib
+import os
 import re
-from typing import Dict, List
-import PyPDF2
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from typing import Dict, List, NamedTuple
+import pypdfium2 as pdfium
 from io import BytesIO
 
+# Patterns compiled once at import; each runs for every parsed resume
+_EXPERIENCE_PATTERNS = [re.compile(p) for p in (
+    r'(\d+)\+?\s*years?\s*of\s*experience',
+    r'experience\s*:?\s*(\d+)\+?\s*years?',
+    r'(\d+)\+?\s*yrs?\s*experience',
+)]
+# Pages past this cap are ignored; real resumes are a handful of pages
+_MAX_PDF_PAGES = 20
+
+# Parse results memoized per content hash; the same resume is often
+# re-uploaded on retries and page refreshes
+_PARSE_CACHE_SIZE = 128
+
+# A-Z -> a-z byte table backing the ASCII fast path in _fast_lower
+_ASCII_LOWER = bytes.maketrans(bytes(range(65, 91)), bytes(range(97, 123)))
+
+_COMPANY_PATTERN = re.compile(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3})\b')
+# One bullet item per match; the quantifier is only a loose prefilter,
+# the strict 20 < len < 200 check runs on the stripped fragment at the
+# use site. The delimiter class covers the bullet (U+2022) and middle
+# dot (U+00B7) seen in modern resumes plus CRLF line endings, not just
+# hyphens and newlines
+_PROJECT_ITEM_PATTERN = re.compile(
+    r'[•·\-\n\r]\s*([^•·\-\n\r]{20,200})(?=[•·\-\n\r]|$)'
+)
+
+# Common tech skills dictionary for matching. Shared by all parser
+# instances so constructing a parser per request costs nothing
+TECH_SKILLS = {
+    'languages': ['python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'ruby',
+                  'go', 'rust', 'php', 'swift', 'kotlin', 'scala', 'r', 'matlab'],
+    'frameworks': ['react', 'angular', 'vue', 'django', 'flask', 'fastapi', 'spring',
+                   'express', 'node.js', 'nodejs', '.net', 'laravel', 'rails'],
+    'databases': ['mysql', 'postgresql', 'mongodb', 'redis', 'cassandra',
+                  'dynamodb', 'oracle', 'sql server', 'sqlite'],
+    'cloud': ['aws', 'azure', 'gcp', 'google cloud', 'kubernetes', 'docker',
+              'terraform', 'jenkins', 'ci/cd'],
+    'ml_ai': ['tensorflow', 'pytorch', 'scikit-learn', 'keras', 'pandas',
+              'numpy', 'machine learning', 'deep learning', 'nlp', 'computer vision'],
+    'tools': ['git', 'jira', 'confluence', 'agile', 'scrum', 'rest api',
+              'graphql', 'microservices']
+}
+
+# Skill -> category map plus one alternation pattern, so extract_skills
+# scans the resume once instead of once per skill.
+# Longest skills first so "google cloud" matches before "cloud"
+_SKILL_TO_CATEGORY = {
+    skill: category
+    for category, skills in TECH_SKILLS.items()
+    for skill in skills
+}
+_SKILL_PATTERN = re.compile(
+    r'\b(?:' +
+    '|'.join(sorted((re.escape(s) for s in _SKILL_TO_CATEGORY),
+                    key=len, reverse=True)) +
+    r')\b'
+)
+
+
+class ExperienceResult(NamedTuple):
+    """Years of experience and employer names from the resume"""
+    years: int
+    companies: List[str]
+
+
+@dataclass(slots=True)
+class ResumeResult:
+    """Parsed resume; attribute access avoids per-field dict lookups"""
+    raw_text: str
+    skills: Dict[str, List[str]]
+    skills_flat_lc: frozenset
+    total_skills: int
+    experience: ExperienceResult
+    projects: List[str]
+
+    def asdict(self) -> Dict:
+        """JSON-shaped dict matching the historical parse() output"""
+        return {
+            'raw_text': self.raw_text,
+            'skills': self.skills,
+            'skills_flat_lc': self.skills_flat_lc,
+            'total_skills': self.total_skills,
+            'experience': {
+                'years': self.experience.years,
+                'companies': self.experience.companies
+            },
+            'projects': self.projects
+        }
+
+
+def _fast_lower(text: str) -> str:
+    """
+    Case-fold text, taking a byte-translate fast path for ASCII
+
+    Resumes are overwhelmingly ASCII, where folding A-Z through a bytes
+    translation table skips the full Unicode case tables that str.lower
+    consults. Non-ASCII text falls back to str.lower() so accented
+    characters survive intact.
+    """
+    if text.isascii():
+        return text.encode('ascii').translate(_ASCII_LOWER).decode('ascii')
+    return text.lower()
+
+
+def _find_header(text_lower: str, header: str, start: int = 0) -> int:
+    """
+    Find a header occurrence that sits on a short, header-like line
+
+    Skipping hits inside long prose lines keeps words like
+    "experienced" or "5+ years of experience" in a summary paragraph
+    from being mistaken for the Experience section header, the same
+    line-length heuristic the JD parser uses for its section headers.
+    """
+    idx = text_lower.find(header, start)
+    while idx != -1:
+        line_start = text_lower.rfind('\n', 0, idx) + 1
+        line_end = text_lower.find('\n', idx)
+        if line_end == -1:
+            line_end = len(text_lower)
+        if line_end - line_start <= 60:
+            return idx
+        idx = text_lower.find(header, idx + 1)
+    return -1
+
+
+def _find_section(text_lower: str, start_headers, end_headers):
+    """
+    Locate a section of the text by literal header search
+
+    All headers are literal strings, so str.find replaces the old
+    lazy-DOTALL section regexes that could backtrack heavily on long
+    resumes. Returns the (start, end) span of the section body so the
+    caller can slice either the lowercased copy or the original text;
+    returns None when no start header is present.
+    """
+    starts = [(idx, header) for header in start_headers
+              if (idx := _find_header(text_lower, header)) != -1]
+    if not starts:
+        return None
+
+    start_idx, header = min(starts)
+    body_start = start_idx + len(header)
+
+    ends = [idx for header in end_headers
+            if (idx := _find_header(text_lower, header, body_start)) != -1]
+    body_end = min(ends) if ends else len(text_lower)
+
+    return body_start, body_end
+
 
 class ResumeParser:
     """Parses resume files to extract candidate information"""
     
     def __init__(self):
-        # Common tech skills dictionary for matching
-        self.tech_skills = {
-            'languages': ['python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'ruby', 
-                         'go', 'rust', 'php', 'swift', 'kotlin', 'scala', 'r', 'matlab'],
-            'frameworks': ['react', 'angular', 'vue', 'django', 'flask', 'fastapi', 'spring', 
-                          'express', 'node.js', 'nodejs', '.net', 'laravel', 'rails'],
-            'databases': ['mysql', 'postgresql', 'mongodb', 'redis', 'cassandra', 
-                         'dynamodb', 'oracle', 'sql server', 'sqlite'],
-            'cloud': ['aws', 'azure', 'gcp', 'google cloud', 'kubernetes', 'docker', 
-                     'terraform', 'jenkins', 'ci/cd'],
-            'ml_ai': ['tensorflow', 'pytorch', 'scikit-learn', 'keras', 'pandas', 
-                     'numpy', 'machine learning', 'deep learning', 'nlp', 'computer vision'],
-            'tools': ['git', 'jira', 'confluence', 'agile', 'scrum', 'rest api', 
-                     'graphql', 'microservices']
-        }
+        # Aliases to the module-level constants, kept for callers that
+        # reach for parser.tech_skills directly
+        self.tech_skills = TECH_SKILLS
+        self._skill_to_category = _SKILL_TO_CATEGORY
+        self._skill_pattern = _SKILL_PATTERN
+        self._parse_cache = OrderedDict()
     
     def parse_pdf(self, file_content: bytes) -> str:
         """Extract text from PDF file"""
+        return "\n".join(self._iter_pdf_pages(BytesIO(file_content)))
+
+    @staticmethod
+    def _iter_pdf_pages(pdf_input):
+        """Yield extracted text page by page via pdfium (C library)"""
         try:
-            pdf_file = BytesIO(file_content)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text()
-            return text
+            pdf = pdfium.PdfDocument(pdf_input)
+            try:
+                for page in pdf:
+                    yield page.get_textpage().get_text_bounded()
+            finally:
+                pdf.close()
         except Exception as e:
             raise Exception(f"Error parsing PDF: {str(e)}")
+
+    def _parse_pdf_incremental(self, pdf_input) -> ResumeResult:
+        """
+        Parse a PDF page by page
+
+        Skills are matched per page and skipped once the whole vocabulary
+        is found, and pages past _MAX_PDF_PAGES are never extracted, so
+        pathological uploads cost bounded work and memory.
+        """
+        pages = []
+        found = {category: set() for category in self.tech_skills}
+        remaining = set(self._skill_to_category)
+
+        for page_index, page_text in enumerate(self._iter_pdf_pages(pdf_input)):
+            if page_index >= _MAX_PDF_PAGES:
+                break
+            pages.append(page_text)
+            if remaining:
+                for match in self._skill_pattern.finditer(_fast_lower(page_text)):
+                    skill = match.group(0)
+                    if skill in remaining:
+                        remaining.discard(skill)
+                        found[self._skill_to_category[skill]].add(skill.title())
+
+        skills = {category: sorted(s) for category, s in found.items() if s}
+        return self._parse_text("\n".join(pages), skills=skills)
     
-    def extract_skills(self, text: str) -> Dict[str, List[str]]:
+    def extract_skills(self, text: str, text_lower: str = None) -> Dict[str, List[str]]:
         """Extract technical skills from resume text"""
-        text_lower = text.lower()
-        extracted_skills = {}
-        
-        for category, skills in self.tech_skills.items():
-            found_skills = []
-            for skill in skills:
-                # Use word boundaries to avoid partial matches
-                pattern = r'\b' + re.escape(skill) + r'\b'
-                if re.search(pattern, text_lower):
-                    found_skills.append(skill.title())
-            
-            if found_skills:
-                extracted_skills[category] = found_skills
-        
-        return extracted_skills
+        if text_lower is None:
+            text_lower = _fast_lower(text)
+        found = {category: set() for category in self.tech_skills}
+
+        # Stop scanning once every vocabulary skill has been seen, the
+        # same short-circuit _parse_pdf_incremental applies per page
+        remaining = set(self._skill_to_category)
+        for match in self._skill_pattern.finditer(text_lower):
+            skill = match.group(0)
+            if skill in remaining:
+                remaining.discard(skill)
+                found[self._skill_to_category[skill]].add(skill.title())
+                if not remaining:
+                    break
+
+        return {category: sorted(skills) for category, skills in found.items() if skills}
     
-    def extract_experience(self, text: str) -> Dict:
+    def extract_experience(self, text: str, text_lower: str = None) -> ExperienceResult:
         """Extract years of experience and work history"""
+        if text_lower is None:
+            text_lower = _fast_lower(text)
+
         # Look for experience patterns
-        exp_patterns = [
-            r'(\d+)\+?\s*years?\s*of\s*experience',
-            r'experience\s*:?\s*(\d+)\+?\s*years?',
-            r'(\d+)\+?\s*yrs?\s*experience'
-        ]
-        
         years_of_experience = 0
-        for pattern in exp_patterns:
-            match = re.search(pattern, text.lower())
+        for pattern in _EXPERIENCE_PATTERNS:
+            match = pattern.search(text_lower)
             if match:
                 years_of_experience = max(years_of_experience, int(match.group(1)))
         
         # Extract company names (basic heuristic)
         companies = []
         # Look for common section headers
-        experience_section = re.search(
-            r'(experience|work history|employment)(.*?)(education|skills|projects|$)',
-            text.lower(),
-            re.DOTALL
-        )
-        
-        if experience_section:
-            section_text = experience_section.group(2)
-            # Look for capitalized phrases that might be company names
-            potential_companies = re.findall(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3})\b', section_text)
-            companies = list(set(potential_companies[:5]))  # Limit to 5 unique
+        span = _find_section(text_lower,
+                             ('experience', 'work history', 'employment'),
+                             ('education', 'skills', 'projects'))
+
+        if span is not None:
+            # Slice the original text, not the lowercased copy: the
+            # company pattern keys on capitalization
+            section_text = text[span[0]:span[1]]
+            # Look for capitalized phrases that might be company names;
+            # dict keys dedup while keeping first-seen order, and the scan
+            # stops as soon as five unique names are collected
+            seen = {}
+            for match in _COMPANY_PATTERN.finditer(section_text):
+                seen.setdefault(match.group(1), None)
+                if len(seen) >= 5:
+                    break
+            companies = list(seen)
         
-        return {
-            'years': years_of_experience,
-            'companies': companies
-        }
+        return ExperienceResult(years=years_of_experience, companies=companies)
     
-    def extract_projects(self, text: str) -> List[str]:
+    def extract_projects(self, text: str, text_lower: str = None) -> List[str]:
         """Extract project names and descriptions"""
+        if text_lower is None:
+            text_lower = _fast_lower(text)
+
         projects = []
-        
+
         # Look for project section
-        project_section = re.search(
-            r'(projects?|portfolio)(.*?)(education|skills|experience|certification|$)',
-            text.lower(),
-            re.DOTALL
-        )
-        
-        if project_section:
-            section_text = project_section.group(2)
-            # Split by bullet points or newlines
-            lines = re.split(r'[•\-\n]', section_text)
-            for line in lines:
-                line = line.strip()
-                # Keep lines that are substantial (likely project descriptions)
-                if len(line) > 20 and len(line) < 200:
-                    projects.append(line[:150])  # Truncate long descriptions
-                if len(projects) >= 5:  # Limit to 5 projects
-                    break
+        span = _find_section(text_lower,
+                             ('project', 'portfolio'),
+                             ('education', 'skills', 'experience', 'certification'))
+
+        if span is not None:
+            section_text = text_lower[span[0]:span[1]]
+            # Capture bounded fragments directly rather than splitting the
+            # whole section into a throwaway list of lines; the stripped
+            # length check keeps the baseline's strict 20-200 bounds
+            projects = list(islice(
+                (frag[:150]  # Truncate long descriptions
+                 for match in _PROJECT_ITEM_PATTERN.finditer(section_text)
+                 if 20 < len(frag := match.group(1).strip()) < 200),
+                5
+            ))
         
         return projects
     
-    def parse(self, file_content: bytes, is_pdf: bool = True) -> Dict:
+    def parse(self, file_content: bytes, is_pdf: bool = True) -> ResumeResult:
         """
         Main parsing function
-        
+
         Args:
             file_content: Resume file content as bytes
             is_pdf: Whether the file is PDF (True) or text (False)
-        
+
         Returns:
-            Dictionary containing extracted resume information
+            ResumeResult with the extracted resume information
         """
-        # Extract text
+        # parse is a pure function of its input, so identical uploads can
+        # reuse the memoized result; BLAKE2 keys cost far less than a parse
+        key = (hashlib.blake2b(file_content, digest_size=16).digest(), is_pdf)
+        cached = self._parse_cache.get(key)
+        if cached is not None:
+            self._parse_cache.move_to_end(key)
+            return cached
+
         if is_pdf:
-            text = self.parse_pdf(file_content)
+            result = self._parse_pdf_incremental(BytesIO(file_content))
         else:
-            text = file_content.decode('utf-8')
-        
-        # Extract all components
-        skills = self.extract_skills(text)
-        experience = self.extract_experience(text)
-        projects = self.extract_projects(text)
+            result = self._parse_text(file_content.decode('utf-8'))
+
+        self._parse_cache[key] = result
+        if len(self._parse_cache) > _PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
+
+        return result
+
+    def parse_stream(self, stream, is_pdf: bool = True) -> ResumeResult:
+        """
+        Parse a resume from a file-like object
+
+        Avoids buffering the whole upload into one bytes object; uploads
+        arrive as spooled temporary files, which pdfium reads directly.
+
+        Args:
+            stream: File-like object positioned at the start of the resume
+            is_pdf: Whether the file is PDF (True) or text (False)
+
+        Returns:
+            ResumeResult with the extracted resume information
+        """
+        if is_pdf:
+            return self._parse_pdf_incremental(stream)
+
+        return self._parse_text(stream.read().decode('utf-8'))
+
+    def parse_many(self, blobs: List[bytes], is_pdf: bool = True) -> List[ResumeResult]:
+        """
+        Parse a batch of resumes concurrently
+
+        pdfium text extraction is C code that releases the GIL, so a
+        thread pool parses a recruiter-style batch across cores without
+        any per-process setup. Results keep the input order.
+
+        Args:
+            blobs: Resume file contents, one bytes object per resume
+            is_pdf: Whether the files are PDF (True) or text (False)
+
+        Returns:
+            List of ResumeResult, one per input blob
+        """
+        if not blobs:
+            return []
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return list(executor.map(lambda blob: self.parse(blob, is_pdf), blobs))
+
+    def _parse_text(self, text: str, skills: Dict[str, List[str]] = None) -> ResumeResult:
+        """Extract all resume components from already-extracted text"""
+        # Lowercase once; every extractor reuses this copy
+        text_lower = _fast_lower(text)
+
+        if skills is None:
+            skills = self.extract_skills(text, text_lower)
+        experience = self.extract_experience(text, text_lower)
+        projects = self.extract_projects(text, text_lower)
         
         # Count total skills
         total_skills = sum(len(skill_list) for skill_list in skills.values())
-        
-        return {
-            'raw_text': text[:1000],  # Store first 1000 chars for reference
-            'skills': skills,
-            'total_skills': total_skills,
-            'experience': experience,
-            'projects': projects
-        }
\ No newline at end of file
+
+        # Keep only a detached 1000-char copy and drop the full document
+        # and its lowercase twin now, so multi-MB resume text is freed
+        # here instead of living until the result propagates upward
+        raw_text = text[:1000]
+        del text, text_lower
+
+        return ResumeResult(
+            raw_text=raw_text,  # Store first 1000 chars for reference
+            skills=skills,
+            skills_flat_lc=frozenset(
+                skill.lower() for skill_list in skills.values() for skill in skill_list
+            ),
+            total_skills=total_skills,
+            experience=experience,
+            projects=projects
+        )
\ No newline at end of file